@@ -0,0 +1,755 @@
+#!/usr/bin/env python3
+"""
+D&B Business Directory Scraper
+
+Scrapes wholesale trade companies in New South Wales from the public
+Dun & Bradstreet business directory and exports them to CSV.
+See INSTRUCTIONS.md for the full workflow description.
+Fields: Company Name, Industry, Location, Sales Revenue ($M)
+"""
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import lxml.html
+from lxml import etree
+import argparse
+import collections
+import concurrent.futures
+import csv
+import itertools
+import threading
+import time
+import logging
+import os
+import random
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Optional
+
+try:
+    import orjson as _json  # ~3x faster loads; optional dependency
+except ImportError:
+    import json as _json
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('scraper.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Patterns compiled once at import; these run per company in the extraction
+# hot loop. The location/revenue variants are fused into one alternation
+# each so the engine scans the context text once instead of per pattern;
+# the named group that matched identifies the variant.
+_LOC_COMBINED = re.compile(
+    r'Country:\s*(?P<loc1>[^,\n]+,\s*New South Wales)'
+    r'|Location:\s*(?P<loc2>[^\n]+?,\s*New South Wales)'
+    r'|Address:\s*(?P<loc3>[^\n]+?,\s*NSW[^\n]*)'
+    r'|(?P<loc4>[A-Z][A-Za-z\s]+,\s*New South Wales)'
+    r'|(?P<loc5>[A-Z][A-Za-z\s]+,\s*NSW\b)'
+    r'|(?P<loc6>[A-Z][A-Za-z\s]+,\s*Australia)',
+    re.IGNORECASE
+)
+_REV_COMBINED = re.compile(
+    r'Sales Revenue\s*\(\$M\)\s*:?\s*\$?\s*(?P<rev1>[\d,.]+)'
+    r'|Revenue:\s*\$?\s*(?P<rev2>[\d,.]+)\s*(?:million|M)\b'
+    r'|Annual Sales:\s*\$?\s*(?P<rev3>[\d,.]+)'
+    r'|\$\s*(?P<rev4>[\d,.]+)\s*million'
+    r'|\$\s*(?P<rev5>[\d,.]+)\s*M\b',
+    re.IGNORECASE
+)
+
+# XPath expressions compiled once; tree.xpath(str) re-parses the
+# expression on every call
+_COMPANY_LINKS_XPATH = etree.XPath('.//a[contains(@href, "company-profiles")]')
+_LISTINGS_ROOT_XPATH = etree.XPath('//main | //*[contains(@class, "results")]')
+_JSON_LD_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()')
+_HAS_NEXT_XPATH = etree.XPath(
+    'boolean(//a[@href]['
+    'contains(translate(text(), "NEXT", "next"), "next")'
+    ' or contains(translate(@aria-label, "NEXT", "next"), "next")'
+    ' or contains(translate(@class, "NEXT", "next"), "next")'
+    ' or contains(text(), "\u203a") or contains(text(), "\u00bb")'
+    ' or contains(@href, "page=")])'
+)
+
+_PAGE_NUM_RE = re.compile(r'page=(\d+)')
+
+# Comments and processing instructions are dead weight for extraction;
+# drop them at parse time. lxml parser objects must not be shared across
+# threads, so each pool worker lazily gets its own instance.
+_PARSER_LOCAL = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    parser = getattr(_PARSER_LOCAL, 'parser', None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(remove_comments=True, remove_pis=True)
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+class SeleniumDNBScraper:
+    """Scraper for the D&B NSW wholesale trade company directory"""
+
+    BASE_URL = ("https://www.dnb.com/business-directory/"
+                "company-information.wholesale_trade.au.new_south_wales.html")
+
+    # Raw HTML is cached on disk so reruns (e.g. while tuning extraction)
+    # do not re-fetch every page
+    CACHE_DIR = os.path.join('.cache', 'dnb')
+    CACHE_TTL = 86400  # seconds
+
+    OUTPUT_FILE = os.path.join('data', 'dnb_wholesale_nsw.csv')
+    FIELDNAMES = ['Company Name', 'Industry', 'Location', 'Sales Revenue ($M)']
+
+    def __init__(self, max_pages: int = 100, use_selenium: bool = False,
+                 delay: Optional[float] = None, remote_url: Optional[str] = None):
+        """Initialize scraper
+
+        By default pages are fetched over plain HTTP with a pooled
+        requests.Session - the directory listing is server-rendered, so a
+        browser is only needed when the site serves an anti-bot challenge.
+        Pass use_selenium=True (or --use-selenium) to force the browser path.
+        A fixed per-request delay can be forced with delay (--delay);
+        otherwise pacing adapts to observed response times. remote_url
+        (--remote-url or SELENIUM_REMOTE_URL) points at a long-lived
+        chromedriver/Selenium service so each run skips the Chrome
+        startup cost.
+        """
+        self.max_pages = max_pages
+        self.use_selenium = use_selenium
+        self.delay = delay
+        self.remote_url = remote_url or os.environ.get('SELENIUM_REMOTE_URL')
+        self.driver = None
+        self.companies_count = 0
+        self._consent_handled = False
+        self._response_times = collections.deque(maxlen=10)
+        self._times_lock = threading.Lock()
+        self._driver_lock = threading.Lock()
+        self._throttled = False
+        # Profile hrefs already emitted; a listing page can reference the
+        # same company from several containers (e.g. sidebar + main list).
+        # Pool workers share the set, so check-and-add happens under a lock.
+        self._seen_hrefs = set()
+        self._seen_lock = threading.Lock()
+
+        # Realistic user agents rotated across requests
+        self.user_agents = [
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0"
+        ]
+
+        # One pooled session reused for every page: a single TCP/TLS
+        # connection covers the whole crawl instead of a browser launch
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': random.choice(self.user_agents),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        })
+
+    def build_page_url(self, page_num: int) -> str:
+        """Construct the URL for a given directory page"""
+        return f"{self.BASE_URL}?page={page_num}"
+
+    def setup_driver(self) -> bool:
+        """Setup Chrome driver with stealth configuration"""
+        try:
+            chrome_options = Options()
+
+            # Basic stealth options
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--window-size=1920,1080")
+
+            # Anti-detection options
+            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            chrome_options.add_experimental_option('useAutomationExtension', False)
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-plugins")
+            chrome_options.add_argument("--disable-images")
+
+            # Performance flags: cut headless startup and idle overhead
+            chrome_options.add_argument("--disable-background-timer-throttling")
+            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+            chrome_options.add_argument("--disable-renderer-backgrounding")
+            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+            # Single-origin crawl: per-site process isolation is pure overhead
+            chrome_options.add_argument("--disable-features=IsolateOrigins,site-per-process")
+            chrome_options.add_argument("--metrics-recording-only")
+            chrome_options.add_argument("--mute-audio")
+            chrome_options.add_argument("--no-first-run")
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+
+            # Random user agent
+            user_agent = random.choice(self.user_agents)
+            chrome_options.add_argument(f"--user-agent={user_agent}")
+
+            # Initialize driver. A persistent remote service (e.g.
+            # chromedriver --port=4444 started once per container) turns
+            # the ~3s Chrome launch into a ~200ms session-creation RPC.
+            if self.remote_url:
+                try:
+                    self.driver = webdriver.Remote(command_executor=self.remote_url,
+                                                   options=chrome_options)
+                    logger.info(f"Using remote driver at {self.remote_url}")
+                except WebDriverException as e:
+                    logger.warning(
+                        f"Remote driver at {self.remote_url} unavailable ({e}), "
+                        "launching local Chrome"
+                    )
+
+            if self.driver is None:
+                try:
+                    self.driver = webdriver.Chrome(options=chrome_options)
+                except Exception:
+                    # Fallback to system chromedriver
+                    service = Service("/usr/local/bin/chromedriver")
+                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
+
+            # Execute stealth scripts
+            stealth_scripts = [
+                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
+                "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})",
+                "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})"
+            ]
+
+            for script in stealth_scripts:
+                try:
+                    self.driver.execute_script(script)
+                except Exception:
+                    pass
+
+            # Block assets we never parse (styles, fonts, media, trackers)
+            # at the network layer
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': [
+                    '*.css', '*.woff*', '*.ttf',
+                    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp',
+                    '*analytics*', '*doubleclick*', '*googletagmanager*'
+                ]})
+            except WebDriverException as e:
+                logger.debug(f"Could not set CDP request blocking: {e}")
+
+            logger.info("Chrome driver initialized successfully")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error setting up driver: {e}")
+            return False
+
+    def looks_blocked(self, html: str) -> bool:
+        """Check response body for anti-bot block / JS-challenge markers"""
+        page_text = html.lower()
+        block_indicators = [
+            'access denied', 'captcha', 'unusual traffic',
+            'bot detected', 'security check', 'challenge-platform',
+            'enable javascript and cookies'
+        ]
+        return any(indicator in page_text for indicator in block_indicators)
+
+    def handle_cookie_consent(self):
+        """Dismiss the cookie consent banner (once per browser session)"""
+        if self._consent_handled:
+            return
+        self._consent_handled = True
+        try:
+            consent_button = WebDriverWait(self.driver, 3).until(
+                EC.element_to_be_clickable((By.ID, "onetrust-accept-btn-handler"))
+            )
+            consent_button.click()
+            logger.info("Cookie consent accepted")
+        except TimeoutException:
+            pass
+        except WebDriverException as e:
+            logger.debug(f"Cookie consent handling failed: {e}")
+
+    def cache_path(self, page_num: int) -> str:
+        """Path of the on-disk HTML cache file for a page"""
+        return os.path.join(self.CACHE_DIR, f'page_{page_num}.html')
+
+    def read_cached_page(self, page_num: int) -> Optional[str]:
+        """Return cached HTML for a page if present and fresh"""
+        path = self.cache_path(page_num)
+        try:
+            if time.time() - os.path.getmtime(path) < self.CACHE_TTL:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return f.read()
+        except OSError:
+            pass
+        return None
+
+    def write_cached_page(self, page_num: int, html: str):
+        """Store fetched HTML in the on-disk cache"""
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(self.cache_path(page_num), 'w', encoding='utf-8') as f:
+                f.write(html)
+        except OSError as e:
+            logger.debug(f"Could not cache page {page_num}: {e}")
+
+    def get_page_content(self, page_num: int) -> Optional[lxml.html.HtmlElement]:
+        """Get page content, using direct HTTP by default
+
+        Fresh pages are served from the disk cache; otherwise falls back
+        to Selenium when the server responds with an anti-bot block (403
+        or a JS-challenge marker in the body).
+        """
+        cached = self.read_cached_page(page_num)
+        if cached is not None:
+            logger.info(f"Page {page_num} served from cache")
+            return lxml.html.fromstring(cached, parser=_html_parser())
+
+        url = self.build_page_url(page_num)
+
+        # Pace only real fetches; cache hits above return without
+        # touching the network and should not wait
+        time.sleep(self.next_delay())
+
+        if not self.use_selenium:
+            try:
+                logger.info(f"Fetching: {url}")
+                # Rotate user agent per request on the shared session
+                self.session.headers['User-Agent'] = random.choice(self.user_agents)
+                fetch_start = time.perf_counter()
+                response = self.session.get(url, timeout=15)
+                with self._times_lock:
+                    self._response_times.append(time.perf_counter() - fetch_start)
+
+                if response.status_code in (403, 429):
+                    logger.warning(f"Server throttling (status {response.status_code}), backing off")
+                    self._throttled = True
+
+                if response.status_code == 200 and not self.looks_blocked(response.text):
+                    self.write_cached_page(page_num, response.text)
+                    return lxml.html.fromstring(response.text, parser=_html_parser())
+
+                if response.status_code == 404:
+                    logger.info(f"Page {page_num} returned 404, end of listing")
+                    return None
+
+                logger.warning(
+                    f"HTTP fetch blocked (status {response.status_code}), "
+                    "falling back to Selenium"
+                )
+                self.use_selenium = True
+            except requests.RequestException as e:
+                logger.warning(f"HTTP fetch failed ({e}), falling back to Selenium")
+                self.use_selenium = True
+
+        # Selenium fallback path. One WebDriver is shared across the
+        # pool workers and Selenium sessions are not thread-safe, so
+        # browser fetches take turns here; the lock also keeps the lazy
+        # setup_driver check from racing and leaking extra Chromes.
+        try:
+            with self._driver_lock:
+                if self.driver is None and not self.setup_driver():
+                    return None
+
+                logger.info(f"Loading in browser: {url}")
+                self.driver.get(url)
+
+                self.handle_cookie_consent()
+
+                # Wait until the listing itself has rendered; this returns as
+                # soon as company links are present, typically sub-second
+                try:
+                    WebDriverWait(self.driver, 8).until(EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, 'a[href*="company-profiles"]')
+                    ))
+                except TimeoutException:
+                    logger.warning(f"No company links rendered on page {page_num}")
+
+                page_source = self.driver.page_source
+
+            if self.looks_blocked(page_source):
+                logger.warning(f"Page {page_num} appears to be blocked")
+                return None
+
+            self.write_cached_page(page_num, page_source)
+            return lxml.html.fromstring(page_source, parser=_html_parser())
+
+        except Exception as e:
+            logger.error(f"Error loading page {page_num}: {e}")
+            return None
+
+    def iter_context_elements(self, link: lxml.html.HtmlElement):
+        """Yield elements near a company link, most likely holder first
+
+        Order: immediate parent, then the surrounding siblings, then the
+        higher ancestors. Callers stop iterating as soon as they have what
+        they need.
+        """
+        parent = link.getparent()
+        if parent is not None:
+            yield parent
+
+        yield from itertools.islice(link.itersiblings(), 3)
+        yield from itertools.islice(link.itersiblings(preceding=True), 3)
+
+        if parent is not None:
+            yield from itertools.islice(parent.iterancestors(), 2)
+
+    def extract_from_json_ld(self, tree: lxml.html.HtmlElement) -> List[Dict]:
+        """Extract company records from embedded JSON-LD, if present
+
+        Structured data gives exact fields and sidesteps the regex
+        heuristics entirely, so it is tried before the link-based scan.
+        """
+        companies = []
+
+        for script in _JSON_LD_XPATH(tree):
+            try:
+                # XPath returns a str subclass, which orjson rejects;
+                # coerce to plain str for both backends
+                data = _json.loads(str(script))
+            except ValueError:
+                continue
+
+            items = data if isinstance(data, list) else [data]
+            for item in list(items):
+                if isinstance(item, dict) and isinstance(item.get('@graph'), list):
+                    items.extend(item['@graph'])
+
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                if item.get('@type') not in ('Organization', 'LocalBusiness'):
+                    continue
+                name = str(item.get('name', '')).strip()
+                if not name:
+                    continue
+
+                location = ''
+                address = item.get('address')
+                if isinstance(address, dict):
+                    parts = [address.get('addressLocality', ''),
+                             address.get('addressRegion', '')]
+                    location = ', '.join(part for part in parts if part)
+                elif isinstance(address, str):
+                    location = address
+
+                revenue = item.get('annualRevenue') or item.get('revenue') or ''
+                if isinstance(revenue, dict):
+                    revenue = revenue.get('value', '')
+
+                companies.append({
+                    'Company Name': name,
+                    'Industry': 'Wholesale Trade',
+                    'Location': location,
+                    'Sales Revenue ($M)': str(revenue)
+                })
+
+        return companies
+
+    def extract_company_data_enhanced(self, tree: lxml.html.HtmlElement, page_num: int) -> List[Dict]:
+        """Extract company records from a directory listing page"""
+        companies = []
+
+        try:
+            companies = self.extract_from_json_ld(tree)
+            if companies:
+                logger.info(f"Extracted {len(companies)} companies from JSON-LD on page {page_num}")
+                return companies
+
+            # Restrict the scan to the listings container when one exists;
+            # headers, footers and scripts never hold company links
+            listing_roots = _LISTINGS_ROOT_XPATH(tree)
+            search_root = listing_roots[0] if listing_roots else tree
+
+            company_links = _COMPANY_LINKS_XPATH(search_root)
+            logger.info(f"Found {len(company_links)} company links on page {page_num}")
+
+            for link in company_links:
+                href = link.get('href')
+                if href:
+                    with self._seen_lock:
+                        if href in self._seen_hrefs:
+                            continue
+                        self._seen_hrefs.add(href)
+
+                name = link.text_content().strip()
+                if not name:
+                    continue
+
+                company = {
+                    'Company Name': name,
+                    'Industry': 'Wholesale Trade',
+                    'Location': '',
+                    'Sales Revenue ($M)': ''
+                }
+
+                # Scan nearby context lazily, most likely element first;
+                # most companies hit on the first or second element, so the
+                # remaining text is never even materialized
+                location = ''
+                revenue = ''
+                for element in self.iter_context_elements(link):
+                    text = element.text_content()
+
+                    if not location:
+                        match = _LOC_COMBINED.search(text)
+                        if match:
+                            location = match.group(match.lastgroup).strip()
+
+                    if not revenue:
+                        match = _REV_COMBINED.search(text)
+                        if match:
+                            revenue = match.group(match.lastgroup).strip()
+
+                    if location and revenue:
+                        break
+
+                company['Location'] = location
+                company['Sales Revenue ($M)'] = revenue
+
+                companies.append(company)
+
+            logger.info(f"Extracted {len(companies)} companies from page {page_num}")
+
+        except Exception as e:
+            logger.error(f"Error extracting data from page {page_num}: {e}")
+
+        return companies
+
+    def analyze_page_structure(self, tree: lxml.html.HtmlElement):
+        """Log a structural summary of a page (debugging aid)
+
+        Not part of the scrape path; costs a dozen extra tree walks per
+        page, so it returns immediately unless debug logging is enabled.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        candidate_selectors = [
+            'div.company-result', 'div.search-result', 'div.listing-item',
+            'div.company-card', 'li.result', 'tr.company-row',
+            'div[class*="company"]', 'div[class*="result"]',
+            'div[class*="business"]', 'div[class*="listing"]',
+            'article', 'section[class*="results"]'
+        ]
+        for selector in candidate_selectors:
+            matches = tree.cssselect(selector)
+            if matches:
+                logger.debug(f"Selector '{selector}' matched {len(matches)} elements")
+
+        pagination_links = tree.xpath('//a[contains(@href, "page=")]')
+        logger.debug(f"Found {len(pagination_links)} pagination links")
+
+        json_ld_scripts = tree.xpath('//script[@type="application/ld+json"]')
+        logger.debug(f"Found {len(json_ld_scripts)} JSON-LD scripts")
+
+        all_links = tree.xpath('//a/@href')
+        logger.debug(f"Page has {len(all_links)} links total")
+
+    def has_next_page(self, tree: lxml.html.HtmlElement) -> bool:
+        """Check whether the listing has a further page"""
+        return bool(_HAS_NEXT_XPATH(tree))
+
+    def next_delay(self) -> float:
+        """Pacing delay for the next request
+
+        Scales with the rolling average response time so a fast server is
+        not waited on needlessly; only escalates to the blunt 3-5s range
+        after the server has signalled throttling (HTTP 429/403).
+        """
+        if self.delay is not None:
+            return self.delay
+
+        if self._throttled:
+            return random.uniform(3.0, 5.0)
+
+        with self._times_lock:
+            if not self._response_times:
+                return random.uniform(0.3, 0.8)
+            rolling_avg = sum(self._response_times) / len(self._response_times)
+
+        return max(0.5, min(2.0, rolling_avg * 0.5))
+
+    def clamp_max_pages(self, tree: lxml.html.HtmlElement):
+        """Bound the crawl by the last page number advertised on page 1
+
+        Saves fetching trailing pages just to find out they are empty.
+        """
+        page_nums = []
+        for href in tree.xpath('//a/@href'):
+            match = _PAGE_NUM_RE.search(href)
+            if match:
+                page_nums.append(int(match.group(1)))
+
+        if page_nums:
+            detected_max = max(page_nums)
+            if detected_max < self.max_pages:
+                logger.info(f"Pagination advertises {detected_max} pages, bounding crawl")
+                self.max_pages = detected_max
+
+    def scrape_page(self, page_num: int) -> Dict:
+        """Fetch and extract a single page (thread pool worker)"""
+        tree = self.get_page_content(page_num)
+        if tree is None:
+            return {'page_num': page_num, 'companies': [], 'has_next': False, 'failed': True}
+
+        if page_num == 1:
+            self.clamp_max_pages(tree)
+
+        companies = self.extract_company_data_enhanced(tree, page_num)
+        return {
+            'page_num': page_num,
+            'companies': companies,
+            'has_next': self.has_next_page(tree),
+            'failed': False
+        }
+
+    def scrape_all_pages(self, max_workers: int = 8):
+        """Scrape the directory with concurrent page fetches
+
+        Page URLs are deterministic, so pages are fetched in parallel and
+        the results collected in page order. Rows are streamed to the CSV
+        as each page completes, so a crash mid-run keeps what was already
+        scraped. Collection stops once two consecutive pages come back
+        without companies.
+        """
+        empty_pages = 0
+
+        def iter_results():
+            # Page 1 is fetched alone so its pagination block can bound
+            # max_pages before the remaining fetches are submitted
+            yield self.scrape_page(1)
+            if self.max_pages < 2:
+                return
+
+            # Submit in a bounded window rather than all pages upfront:
+            # when the consumer breaks out early, only the in-flight
+            # window is left to discard instead of every remaining page
+            # (executor.map would block shutdown until all of them ran)
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                pages = iter(range(2, self.max_pages + 1))
+                window = collections.deque(
+                    executor.submit(self.scrape_page, page_num)
+                    for page_num in itertools.islice(pages, max_workers * 2)
+                )
+                while window:
+                    result = window.popleft().result()
+                    next_page = next(pages, None)
+                    if next_page is not None:
+                        window.append(executor.submit(self.scrape_page, next_page))
+                    yield result
+            finally:
+                # Also runs when the consumer's break closes the generator
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        os.makedirs(os.path.dirname(self.OUTPUT_FILE), exist_ok=True)
+        with open(self.OUTPUT_FILE, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=self.FIELDNAMES,
+                                    extrasaction='ignore', restval='')
+            writer.writeheader()
+
+            for result in iter_results():
+                page_num = result['page_num']
+                companies = result['companies']
+
+                if result['failed']:
+                    logger.warning(f"Could not load page {page_num}, stopping")
+                    break
+
+                if not companies:
+                    empty_pages += 1
+                    if empty_pages >= 2:
+                        logger.info("Two consecutive empty pages, stopping")
+                        break
+                    continue
+
+                empty_pages = 0
+                writer.writerows(companies)
+                csvfile.flush()
+                self.companies_count += len(companies)
+                logger.info(f"Total companies collected: {self.companies_count}")
+
+                if not result['has_next']:
+                    logger.info(f"No next page link found on page {page_num}, stopping")
+                    break
+
+    def run(self) -> bool:
+        """Run the scraper"""
+        logger.info("Starting D&B directory scraper...")
+
+        try:
+            self.scrape_all_pages()
+
+            if self.companies_count:
+                logger.info(
+                    f"Scraping completed! Saved {self.companies_count} companies "
+                    f"to {self.OUTPUT_FILE}"
+                )
+                return True
+            else:
+                logger.warning("No data was scraped")
+                return False
+
+        except KeyboardInterrupt:
+            # Rows already written are safe on disk
+            logger.info("Scraping interrupted by user")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return False
+        finally:
+            if self.driver:
+                self.driver.quit()
+                logger.info("Browser closed")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Scrape the D&B NSW wholesale trade directory')
+    parser.add_argument('--max-pages', type=int, default=100,
+                        help='Maximum number of listing pages to scrape')
+    parser.add_argument('--use-selenium', action='store_true',
+                        help='Force the headless browser path instead of direct HTTP')
+    parser.add_argument('--delay', type=float, default=None,
+                        help='Fixed delay between requests in seconds (default: adaptive)')
+    parser.add_argument('--remote-url', default=None,
+                        help='URL of a persistent Selenium/chromedriver service '
+                             '(e.g. http://localhost:4444/wd/hub)')
+    args = parser.parse_args()
+
+    scraper = SeleniumDNBScraper(max_pages=args.max_pages, use_selenium=args.use_selenium,
+                                 delay=args.delay, remote_url=args.remote_url)
+
+    try:
+        success = scraper.run()
+        if success:
+            logger.info("Scraping completed successfully!")
+        else:
+            logger.error("Scraping failed")
+    except Exception as e:
+        logger.error(f"Error in main: {e}")
+
+
+if __name__ == "__main__":
+    main()